@@ -1,13 +1,23 @@
+import os
+
 from .__version__ import __version__
-print(f"pycvcam_viz version: {__version__}")
-import sys
-print(f"Python version: {sys.version}")
-print(f"Platform: {sys.platform}")
-print(f"Python executable: {sys.executable}")
+
+if os.environ.get("PYCVCAM_VIZ_DEBUG"):
+    import sys
+    print(f"pycvcam_viz version: {__version__}")
+    print(f"Python version: {sys.version}")
+    print(f"Platform: {sys.platform}")
+    print(f"Python executable: {sys.executable}")
 
 __all__ = [
     "__version__",
 ]
 
-from .zernike_distortion_visualizer import ZernikeDistortionVisualizerUI
-__all__.extend(['ZernikeDistortionVisualizerUI'])
\ No newline at end of file
+__all__.extend(['ZernikeDistortionVisualizerUI'])
+
+def __getattr__(name):
+    # Lazy import of the GUI (PEP 562) : matplotlib and PyQt5 are only imported when needed
+    if name == "ZernikeDistortionVisualizerUI":
+        from .zernike_distortion_visualizer import ZernikeDistortionVisualizerUI
+        return ZernikeDistortionVisualizerUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,7 +1,7 @@
 import sys
 import os
 import numpy
-from typing import List
+from typing import Dict, List, Tuple
 
 from pycvcam import ZernikeDistortion
 from pycvcam import read_transform
@@ -11,22 +11,174 @@ from PyQt5.QtWidgets import (
     QListWidget, QLabel, QSplitter, QPushButton, QFileDialog,
     QMessageBox, QHBoxLayout, QComboBox, QListWidgetItem, QCheckBox
 )
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import Qt, QUrl, QTimer, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, numpy is used instead
+    njit = None
+
+
+# ============================================================
+# Caches shared by the redraws
+# ============================================================
+_TICKLABEL_CACHE: Dict[Tuple[int, str], Tuple[List[str], numpy.ndarray]] = {}
+_COLOR_CACHE: Dict[int, numpy.ndarray] = {}
+
+
+def _zernike_ticklabels(Nzer: int, mode: str) -> Tuple[List[str], numpy.ndarray]:
+    r"""
+    Return the tick labels and the bar positions for the Zernike coefficients up to the order ``Nzer``.
+    The result is cached by ``(Nzer, mode)`` so repeated redraws skip the construction.
+    """
+    key = (Nzer, mode)
+    if key not in _TICKLABEL_CACHE:
+        # Valid (n, m) indices: |m| <= n and n + m even, ordered by n then m
+        N, M = numpy.meshgrid(numpy.arange(Nzer + 1), numpy.arange(-Nzer, Nzer + 1), indexing='ij')
+        mask = (numpy.abs(M) <= N) & ((N + M) % 2 == 0)
+        ticklabels = [f"C{mode}({n}, {m})" for n, m in zip(N[mask].tolist(), M[mask].tolist())]
+        _TICKLABEL_CACHE[key] = (ticklabels, numpy.arange(len(ticklabels)))
+    return _TICKLABEL_CACHE[key]
+
+
+def _distortion_colors(num_distortions: int) -> numpy.ndarray:
+    r"""
+    Return the (num_distortions, 4) RGBA colors used for ``num_distortions`` superimposed bar series (cached).
+    """
+    if num_distortions not in _COLOR_CACHE:
+        colormap = plt.get_cmap('viridis')
+        _COLOR_CACHE[num_distortions] = colormap(numpy.arange(num_distortions) / num_distortions)
+    return _COLOR_CACHE[num_distortions]
+
+
+# ============================================================
+# Coefficients preprocessing
+# ============================================================
+if njit is not None:
+    @njit(cache=True)
+    def _aggregate_coefficients(parameters, absolute):
+        r"""
+        Compute the bar heights of a (models, coefficients) parameters matrix (absolute values if ``absolute``).
+        """
+        heights = numpy.empty_like(parameters)
+        for i in range(parameters.shape[0]):
+            for j in range(parameters.shape[1]):
+                value = parameters[i, j]
+                heights[i, j] = abs(value) if absolute else value
+        return heights
+else:
+    def _aggregate_coefficients(parameters, absolute):
+        r"""
+        Compute the bar heights of a (models, coefficients) parameters matrix (absolute values if ``absolute``).
+        """
+        return numpy.abs(parameters) if absolute else parameters
+
 
 # ============================================================
 # Canvas Matplotlib
 # ============================================================
 class MplCanvas(FigureCanvas):
-    r"""Canvas matplotlib integrated into PyQt."""
+    r"""
+    Canvas matplotlib integrated into PyQt.
+
+    The static part of the axes (frame, ticks, grid) is cached after each full draw
+    so that the dynamic artists (bars and legend) can be blitted over it.
+    """
     def __init__(self, parent=None):
-        fig = Figure(figsize=(5, 4), dpi=100)
+        fig = Figure(figsize=(5, 4), dpi=100, layout=None)  # No layout engine run at each draw
         self.axes = fig.add_subplot(111)
         super().__init__(fig)
+        self.layout_key = None  # Key of the static layout currently drawn (Nzer, mode)
+        self._background = None  # Cached static background of the axes
+        self._background_limits = None  # Axes limits when the background was cached
+        self._dynamic_artists = []  # Artists blitted over the background
+        self.bars = []  # Bars currently drawn (file-major order)
+        self.parameters = None  # Signed parameters matrix of the bars currently drawn
+        self.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        r"""
+        Cache the static background after a full draw and draw the dynamic artists over it.
+        """
+        self._background = self.copy_from_bbox(self.axes.bbox)
+        self._background_limits = (self.axes.get_xlim(), self.axes.get_ylim())
+        for artist in self._dynamic_artists:
+            self.axes.draw_artist(artist)
+
+    def clear_plot(self):
+        r"""
+        Clear the axes and invalidate the cached background.
+        """
+        self.axes.clear()
+        self.layout_key = None
+        self._background = None
+        self._background_limits = None
+        self._dynamic_artists = []
+        self.bars = []
+        self.parameters = None
+
+    def remove_dynamic_artists(self):
+        r"""
+        Remove the dynamic artists from the axes, keeping the static layout.
+        """
+        for artist in self._dynamic_artists:
+            artist.remove()
+        self._dynamic_artists = []
+        self.bars = []
+        self.parameters = None
+
+    def set_absolute(self, absolute):
+        r"""
+        Update the heights of the drawn bars to the absolute (or signed) parameters without rebuilding the plot.
+        The y-limits set by :meth:`fit_ylim` cover both cases, so the bars are only blitted.
+        """
+        if self.parameters is None:
+            return
+        heights = _aggregate_coefficients(self.parameters, absolute)
+        for bar, height in zip(self.bars, heights.ravel()):
+            bar.set_height(height)
+        self.refresh()
+
+    def fit_ylim(self, parameters):
+        r"""
+        Set the y-limits (with a 5% margin) to a range containing the bars of the signed parameters
+        and of their absolute values, so that the limits do not change when toggling absolute values.
+        Non-finite parameters (NaN, inf) are ignored; the range is [-1, 1] if no finite value is left.
+        """
+        finite = parameters[numpy.isfinite(parameters)]
+        low = min(float(finite.min()), 0.0) if finite.size else 0.0
+        high = max(float(numpy.abs(finite).max()), 0.0) if finite.size else 0.0
+        if high == low:
+            self.axes.set_ylim(low - 1.0, high + 1.0)
+            return
+        margin = 0.05 * (high - low)
+        self.axes.set_ylim(low - margin if low < 0 else 0.0, high + margin if high > 0 else 0.0)
+
+    def set_dynamic_artists(self, artists):
+        r"""
+        Register the artists to blit over the cached background.
+        """
+        for artist in artists:
+            artist.set_animated(True)
+        self._dynamic_artists = list(artists)
+
+    def refresh(self):
+        r"""
+        Blit the dynamic artists if the cached background is still valid, otherwise perform a full draw.
+        """
+        limits = (self.axes.get_xlim(), self.axes.get_ylim())
+        if self._background is None or limits != self._background_limits:
+            self.draw()
+            return
+        self.restore_region(self._background)
+        for artist in self._dynamic_artists:
+            self.axes.draw_artist(artist)
+        self.blit(self.axes.bbox)
 
 # ============================================================
 # Bar plot on an axes
@@ -55,32 +207,70 @@ def plot_bar_chart(mpl_canvas: MplCanvas, distortions: List[ZernikeDistortion],
     if not mode in ["x", "y"]:
         raise ValueError("Invalid mode, must be 'x' or 'y'")
 
-    # Clear the axes
-    mpl_canvas.axes.clear()
-
     # Extract the maximum order
     Nzer = max(distortion.Nzer for distortion in distortions)
 
-    # Constructs the labels and parameters
-    ticklabels = [f"C{mode}({n}, {m})" for n in range(Nzer + 1) for m in range(-n, n + 1) if (n + m) % 2 == 0]
-    x = numpy.arange(len(ticklabels))  # Position of the bars on the x-axis
-    x_width = 0.8 / len(distortions)  # Width of each bar
+    # Zero-padded parameters of all the distortions (one row per distortion)
+    num_bins = len(_zernike_ticklabels(Nzer, mode)[0])
+    parameters = stack_parameters([distortion.parameters_x if mode == "x" else distortion.parameters_y for distortion in distortions], num_bins)
+
+    return plot_parameters(mpl_canvas, parameters, Nzer, labels, mode=mode, absolute=absolute)
+
+
+def stack_parameters(parameters_list: List[numpy.ndarray], num_bins: int) -> numpy.ndarray:
+    r"""
+    Stack the parameters vectors into a single zero-padded float32 matrix of shape (len(parameters_list), num_bins),
+    the same layout as :meth:`ZernikeFileData.parameter_matrix`.
+    """
+    parameters = numpy.zeros((len(parameters_list), num_bins), dtype=numpy.float32)
+    for i, vector in enumerate(parameters_list):
+        parameters[i, :len(vector)] = vector
+    return parameters
+
+
+def plot_parameters(mpl_canvas: MplCanvas, parameters: numpy.ndarray, Nzer: int, labels: List[str], mode: str = "x", absolute: bool = False) -> MplCanvas:
+    r"""
+    Plot a bar chart of a zero-padded matrix of Zernike coefficients (one row per model) up to the order ``Nzer``.
+    """
+    if not mode in ["x", "y"]:
+        raise ValueError("Invalid mode, must be 'x' or 'y'")
+
+    ticklabels, x = _zernike_ticklabels(Nzer, mode)  # Labels and position of the bars on the x-axis
+
+    if not isinstance(parameters, numpy.ndarray) or parameters.shape != (len(labels), len(ticklabels)):
+        raise ValueError("Parameters must be an array of shape (len(labels), number of coefficients)")
+
+    # Rebuild the static layout only if the order or the mode changed
+    if mpl_canvas.layout_key != (Nzer, mode):
+        mpl_canvas.clear_plot()
+        mpl_canvas.axes.set_xticks(x)
+        mpl_canvas.axes.set_xticklabels(ticklabels, rotation=75)
+        mpl_canvas.axes.set_title(f"Zernike Coefficients [{mode}-axis]")
+        mpl_canvas.axes.grid(True, linestyle='--', alpha=0.5)
+        mpl_canvas.axes.set_autoscale_on(False)
+        mpl_canvas.axes.set_xlim(x[0] - 0.5, x[-1] + 0.5)
+        mpl_canvas.layout_key = (Nzer, mode)
+    else:
+        mpl_canvas.remove_dynamic_artists()
+
+    num_models = parameters.shape[0]
+    x_width = 0.8 / num_models  # Width of each bar
     x_shift = -0.4 + x_width / 2  # Center the bars
-    colormap = plt.get_cmap('viridis')
-
-    for i, distortion in enumerate(distortions):
-        parameters = distortion.parameters_x if mode == "x" else distortion.parameters_y
-        parameters = numpy.concatenate([parameters, numpy.zeros(len(ticklabels) - len(parameters))])
-        if absolute:
-            parameters = numpy.abs(parameters)
-        mpl_canvas.axes.bar(x + x_shift + i * x_width, parameters, width=x_width, label=labels[i], color=colormap(i / len(distortions)))
-
-    mpl_canvas.axes.set_xticks(x)
-    mpl_canvas.axes.set_xticklabels(ticklabels, rotation=75)
-    mpl_canvas.axes.set_title(f"Zernike Coefficients [{mode}-axis]")
-    mpl_canvas.axes.legend()
-    mpl_canvas.axes.grid(True, linestyle='--', alpha=0.5)
-    mpl_canvas.draw()
+    colors = _distortion_colors(num_models)
+
+    # Draw all the bars with a single call (file-major order)
+    xs = (x[None, :] + x_shift + numpy.arange(num_models)[:, None] * x_width).ravel()
+    heights = _aggregate_coefficients(parameters, absolute)
+    bar_colors = numpy.repeat(colors, len(x), axis=0)
+    bars = mpl_canvas.axes.bar(xs, heights.ravel(), width=x_width, color=bar_colors)
+    legend = mpl_canvas.axes.legend(handles=[Patch(color=color, label=label) for color, label in zip(colors, labels)])
+    mpl_canvas.set_dynamic_artists(list(bars.patches) + [legend])
+    mpl_canvas.bars = list(bars.patches)
+    mpl_canvas.parameters = parameters
+
+    # Update the limits to the new bars and redraw
+    mpl_canvas.fit_ylim(parameters)
+    mpl_canvas.refresh()
     return mpl_canvas
 
 # ============================================================
@@ -97,6 +287,150 @@ def truncate_filename(file_path, max_len=30):
     return f"{name[:part_len]}...{name[-part_len:]}"
 
 
+# ============================================================
+# File loading
+# ============================================================
+def read_zernike_file(file_path):
+    r"""
+    Read a Zernike distortion file and precompute the data used by the redraws.
+
+    Returns a dictionary with the keys ``distortion``, ``label`` (truncated filename),
+    ``parameters_x`` and ``parameters_y`` (the arrays of the distortion, not copied).
+    """
+    distortion = read_transform(file_path, ZernikeDistortion)
+    return {
+        "distortion": distortion,
+        "label": truncate_filename(file_path),
+        "parameters_x": distortion.parameters_x,
+        "parameters_y": distortion.parameters_y,
+    }
+
+
+class ZernikeFileData:
+    r"""
+    Storage of the loaded files (file path -> entry returned by :func:`read_zernike_file`).
+
+    The parameters of all the files are also copied into two contiguous float32 matrices
+    (one row per file, grown by doubling), so that the parameters of a selection are gathered
+    with a single slicing operation. Files are added and removed with :meth:`add` and :meth:`remove`.
+    """
+
+    def __init__(self):
+        self._entries = {}  # File path -> entry
+        self._rows = {}  # File path -> row in the matrices
+        self._param_matrix_x = numpy.zeros((0, 0), dtype=numpy.float32)
+        self._param_matrix_y = numpy.zeros((0, 0), dtype=numpy.float32)
+        self._num_rows = 0  # Number of rows already used (including the freed ones)
+        self._free_rows = []  # Rows released by removed files
+
+    def __contains__(self, file_path):
+        return file_path in self._entries
+
+    def __getitem__(self, file_path):
+        return self._entries[file_path]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _reserve(self, num_bins):
+        r"""
+        Grow the matrices (doubling their capacity) to store one more file with ``num_bins`` parameters.
+        """
+        capacity_rows, capacity_bins = self._param_matrix_x.shape
+        rows = capacity_rows
+        if not self._free_rows and self._num_rows == capacity_rows:
+            rows = max(1, 2 * capacity_rows)
+        bins = capacity_bins
+        if num_bins > capacity_bins:
+            bins = max(num_bins, 2 * capacity_bins)
+        if (rows, bins) == (capacity_rows, capacity_bins):
+            return
+        for name in ("_param_matrix_x", "_param_matrix_y"):
+            matrix = numpy.zeros((rows, bins), dtype=numpy.float32)
+            matrix[:capacity_rows, :capacity_bins] = getattr(self, name)
+            setattr(self, name, matrix)
+
+    def add(self, file_path, entry):
+        r"""
+        Add (or replace) a file and copy its parameters into the matrices.
+        """
+        if file_path in self:
+            self.remove(file_path)
+        parameters_x = entry["parameters_x"]
+        parameters_y = entry["parameters_y"]
+        self._reserve(max(len(parameters_x), len(parameters_y)))
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._num_rows
+            self._num_rows += 1
+        self._param_matrix_x[row, :len(parameters_x)] = parameters_x
+        self._param_matrix_y[row, :len(parameters_y)] = parameters_y
+        self._entries[file_path] = entry
+        self._rows[file_path] = row
+
+    def remove(self, file_path):
+        r"""
+        Remove a file and release its row in the matrices.
+        """
+        del self._entries[file_path]
+        row = self._rows.pop(file_path)
+        self._param_matrix_x[row] = 0.0
+        self._param_matrix_y[row] = 0.0
+        self._free_rows.append(row)
+
+    def parameter_matrix(self, file_paths, mode, num_bins):
+        r"""
+        Return the zero-padded parameters of the given files as a (len(file_paths), num_bins) float32 matrix.
+        """
+        matrix = self._param_matrix_x if mode == "x" else self._param_matrix_y
+        rows = [self._rows[file_path] for file_path in file_paths]
+        return matrix[rows, :num_bins]
+
+
+def add_file_items(file_list_widget, file_items, file_paths):
+    r"""
+    Add the file paths to the QListWidget in a single batch and register the created items in file_items.
+    """
+    if not file_paths:
+        return
+    start = file_list_widget.count()
+    file_list_widget.setUpdatesEnabled(False)
+    file_list_widget.addItems(file_paths)
+    file_list_widget.setUpdatesEnabled(True)
+    for index, file_path in enumerate(file_paths):
+        file_items[file_path] = file_list_widget.item(start + index)
+
+
+class _LoadSignals(QObject):
+    r"""
+    Signals emitted by a :class:`_LoadTask` (delivered in the GUI thread).
+    """
+    loaded = pyqtSignal(str, object)  # File path, entry returned by read_zernike_file
+    failed = pyqtSignal(str, str)  # File path, error message
+
+
+class _LoadTask(QRunnable):
+    r"""
+    Read a Zernike distortion file in a worker thread of a QThreadPool.
+    """
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            entry = read_zernike_file(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        self.signals.loaded.emit(self.file_path, entry)
+
+
 # ============================================================
 # DropWidget
 # ============================================================
@@ -104,16 +438,26 @@ class DropWidget(QWidget):
     """
     Drag-and-drop widget for loading files into the application.
 
-    Supports multiple file selection and updates a given QListWidget and file_data dictionary.
+    Supports multiple file selection and updates a given QListWidget, the file_data storage (:class:`ZernikeFileData`)
+    and the file_items dictionary (file path -> QListWidgetItem).
+    The files are read in a thread pool so that the GUI stays responsive.
     """
 
-    def __init__(self, file_list_widget, file_data, statusbar):
+    def __init__(self, file_list_widget, file_data, file_items, statusbar):
         super().__init__()
         self.setAcceptDrops(True)
         self.file_list_widget = file_list_widget
         self.file_data = file_data
+        self.file_items = file_items
         self.statusbar = statusbar
 
+        # Files loading in the background
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(max(1, min(4, QThread.idealThreadCount())))  # Bound concurrent disk I/O
+        self._pending = {}  # File path -> _LoadTask being read
+        self._dropped_paths = []  # Paths to select when the pending loads are done
+        self._new_paths = []  # Paths loaded since the last batch was added
+
         # Instruction label
         self.label = QLabel("Drag your files here", self)
         self.label.setAlignment(Qt.AlignCenter)
@@ -174,10 +518,13 @@ class DropWidget(QWidget):
     def dropEvent(self, event):
         r"""
         Handle the drop event for the widget.
-        Loads the dropped files into the file_data dictionary and updates the file_list_widget.
+        Starts reading the dropped files in the thread pool. The file_data storage and the
+        file_list_widget are updated in the GUI thread once all the files are read.
         """
-        urls = self._extract_urls(event.mimeData())
-        if not urls:
+        # Convert the URLs to local paths once, skipping the non-file URLs
+        local_paths = [qurl.toLocalFile() for qurl in self._extract_urls(event.mimeData())]
+        local_paths = [file_path for file_path in local_paths if file_path]
+        if not local_paths:
             event.ignore()
             self._reset_style()
             return
@@ -185,33 +532,73 @@ class DropWidget(QWidget):
         event.acceptProposedAction()
         self._reset_style()
 
-        loaded_count = 0
-        for qurl in urls:
-            file_path = qurl.toLocalFile()
-            if not file_path or file_path in self.file_data:
+        self._dropped_paths.extend(local_paths)
+        for file_path in local_paths:
+            if file_path in self.file_data or file_path in self._pending:
                 continue  # Skip already loaded files
 
-            try:
-                distortion = read_transform(file_path, ZernikeDistortion)
-                self.file_data[file_path] = distortion
-                self.file_list_widget.addItem(file_path)
-                loaded_count += 1
-            except Exception as e:
-                QMessageBox.warning(
-                    self, "File Read Error",
-                    f"Unable to read {file_path}:\n{e}"
-                )
-
-        # Select all newly added files
-        for qurl in urls:
-            file_path = qurl.toLocalFile()
-            if not file_path:
-                continue
-            items = self.file_list_widget.findItems(file_path, Qt.MatchExactly)
-            for item in items:
-                item.setSelected(True)
+            task = _LoadTask(file_path)
+            task.signals.loaded.connect(self._on_loaded)
+            task.signals.failed.connect(self._on_failed)
+            self._pending[file_path] = task
+            self._thread_pool.start(task)
 
-        self.statusbar.showMessage(f"{loaded_count} file(s) loaded")
+        if self._pending:
+            self.statusbar.showMessage(f"Loading {len(self._pending)} file(s)...")
+        else:
+            self._finish_loading()
+
+    def _on_loaded(self, file_path, entry):
+        r"""
+        Store a file read by a worker thread (unless it has been loaded in the meantime).
+        """
+        if file_path not in self.file_data and file_path not in self.file_items:
+            self.file_data.add(file_path, entry)
+            self._new_paths.append(file_path)
+        self._task_done(file_path)
+
+    def is_loading(self, file_path):
+        r"""
+        Return True if the file is being read or waits to be added to the QListWidget.
+        """
+        return file_path in self._pending or file_path in self._new_paths
+
+    def _on_failed(self, file_path, message):
+        r"""
+        Report a file that could not be read by a worker thread.
+        """
+        QMessageBox.warning(
+            self, "File Read Error",
+            f"Unable to read {file_path}:\n{message}"
+        )
+        self._task_done(file_path)
+
+    def _task_done(self, file_path):
+        r"""
+        Forget a finished task and finish the loading once all the pending files are read.
+        """
+        self._pending.pop(file_path, None)
+        if not self._pending:
+            self._finish_loading()
+
+    def _finish_loading(self):
+        r"""
+        Add the loaded files to the QListWidget and select all the dropped files.
+        """
+        new_paths, self._new_paths = self._new_paths, []
+        dropped_paths, self._dropped_paths = self._dropped_paths, []
+        add_file_items(self.file_list_widget, self.file_items, new_paths)
+
+        # Select all dropped files (a single selection change is emitted at the end)
+        # The previous blocking state is restored, since this may run inside a blocked section of open_files
+        previous = self.file_list_widget.blockSignals(True)
+        for file_path in dropped_paths:
+            if file_path in self.file_items:
+                self.file_items[file_path].setSelected(True)
+        self.file_list_widget.blockSignals(previous)
+        self.file_list_widget.itemSelectionChanged.emit()
+
+        self.statusbar.showMessage(f"{len(new_paths)} file(s) loaded")
 
 
 
@@ -228,14 +615,19 @@ class ZernikeDistortionVisualizerUI(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self.file_data = {}
+        self.file_data = ZernikeFileData()
+        self.file_items = {}  # File path -> QListWidgetItem
+        self._redraw_pending = False  # A redraw is already scheduled in the event loop
+
+        # Compile the coefficients kernel now rather than on the first plot
+        _aggregate_coefficients(numpy.zeros((1, 1), dtype=numpy.float32), True)
 
         splitter = QSplitter()
 
         # --- File list ---
         self.file_list = QListWidget()
         self.file_list.setSelectionMode(QListWidget.ExtendedSelection)
-        self.file_list.itemSelectionChanged.connect(self.update_plot)
+        self.file_list.itemSelectionChanged.connect(self.schedule_update_plot)
 
         # --- Figure selector ---
         self.figure_selector = QComboBox()
@@ -244,13 +636,19 @@ class ZernikeDistortionVisualizerUI(QMainWindow):
 
         # --- Absolute value checkbox ---
         self.abs_checkbox = QCheckBox("Absolute values")
-        self.abs_checkbox.stateChanged.connect(self.update_plot)
+        self.abs_checkbox.stateChanged.connect(self._toggle_abs)
+
+        # --- Open dialog (built once and reused) ---
+        self._open_dialog = QFileDialog(self, "Select files")
+        self._open_dialog.setFileMode(QFileDialog.ExistingFiles)
+        self._open_dialog.setNameFilters(["JSON Files (*.json)", "All Files (*)"])
+        self._open_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
 
         # --- Status bar ---
         self.statusbar = self.statusBar()
 
         # --- Drop area ---
-        self.drop_area = DropWidget(self.file_list, self.file_data, self.statusbar)
+        self.drop_area = DropWidget(self.file_list, self.file_data, self.file_items, self.statusbar)
 
         # --- Left panel ---
         left_panel = QWidget()
@@ -288,12 +686,16 @@ class ZernikeDistortionVisualizerUI(QMainWindow):
         r"""
         Remove the selected files from the list and the internal data storage.
         """
-        selected_items = self.file_list.selectedItems()
-        for item in selected_items:
-            file_path = item.text()
+        # Walk the rows backwards so that taking an item does not shift the rows left to visit
+        previous = self.file_list.blockSignals(True)  # The plot is updated once at the end
+        for row in reversed(range(self.file_list.count())):
+            if not self.file_list.item(row).isSelected():
+                continue
+            file_path = self.file_list.takeItem(row).text()
             if file_path in self.file_data:
-                del self.file_data[file_path]
-            self.file_list.takeItem(self.file_list.row(item))
+                self.file_data.remove(file_path)
+            self.file_items.pop(file_path, None)
+        self.file_list.blockSignals(previous)
         self.update_plot()
 
     def open_files(self):
@@ -301,64 +703,91 @@ class ZernikeDistortionVisualizerUI(QMainWindow):
         Open a file dialog to select and load Zernike distortion files.
         Supports multiple file selection.
         """
-        dialog = QFileDialog(self, "Select files")
-        dialog.setFileMode(QFileDialog.ExistingFiles)
-        dialog.setNameFilters(["JSON Files (*.json)", "All Files (*)"])
-        dialog.setOption(QFileDialog.DontUseNativeDialog, True)
-
-        if dialog.exec_():
-            paths = dialog.selectedFiles()
+        if self._open_dialog.exec_():
+            paths = self._open_dialog.selectedFiles()
+            previous = self.file_list.blockSignals(True)  # The plot is updated once at the end
+            new_paths = []
             for p in paths:
+                if self.drop_area.is_loading(p):
+                    continue  # Added and selected when the dropped files are loaded
                 if p in self.file_data:
-                    items = self.file_list.findItems(p, Qt.MatchExactly)
-                    if items:
-                        self.file_list.setCurrentItem(items[0])
+                    self.file_list.setCurrentItem(self.file_items[p])
                     continue
 
                 try:
-                    distortion = read_transform(p, ZernikeDistortion)
-                    self.file_data[p] = distortion
-                    self.file_list.addItem(p)
+                    self.file_data.add(p, read_zernike_file(p))
+                    new_paths.append(p)
                 except Exception as e:
                     QMessageBox.warning(self, "File Read Error", f"Unable to read {p}:\n{e}")
 
+            add_file_items(self.file_list, self.file_items, new_paths)
             for p in paths:
-                items = self.file_list.findItems(p, Qt.MatchExactly)
-                if items:
-                    items[0].setSelected(True)
+                if p in self.file_items:
+                    self.file_items[p].setSelected(True)
+            self.file_list.blockSignals(previous)
 
             self.update_plot()
 
     # --- Plot update ---
+    def schedule_update_plot(self):
+        r"""
+        Schedule a single plot update in the event loop.
+        Rapid selection changes are coalesced into one redraw of the final selection.
+        """
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            QTimer.singleShot(0, self._do_update_plot)
+
+    def _toggle_abs(self):
+        r"""
+        Switch the drawn bars between absolute and signed values.
+        Only the bar heights change, so the plot is not rebuilt.
+        """
+        if self._redraw_pending:
+            return  # The scheduled update reads the checkbox state
+        if self.canvas.parameters is None:
+            self.update_plot()
+            return
+        self.canvas.set_absolute(self.abs_checkbox.isChecked())
+
+    def _do_update_plot(self):
+        r"""
+        Perform the scheduled plot update.
+        """
+        self._redraw_pending = False
+        self.update_plot()
+
     def update_plot(self):
         r"""
         Update the matplotlib plot based on the selected files and figure type.
         """
         selected_items = self.file_list.selectedItems()
-        self.canvas.axes.clear()
 
         if not selected_items:
+            self.canvas.clear_plot()
             self.canvas.draw()
             return
 
         fig_choice = self.figure_selector.currentText()
         use_abs = self.abs_checkbox.isChecked()  # <-- lire le checkbox
 
-        distortions = []
-        labels = []
+        paths = [item.text() for item in selected_items if item.text() in self.file_data]
 
-        for item in selected_items:
-            file_path = item.text()
-            distortion = self.file_data.get(file_path)
-            if distortion:
-                distortions.append(distortion)
-                labels.append(truncate_filename(file_path))
-
-        if not distortions:
+        if not paths:
+            self.canvas.clear_plot()
             self.canvas.draw()
             return
 
         if fig_choice.startswith("Figure 1"):
-            self.canvas = plot_bar_chart(self.canvas, distortions, labels, mode="x", absolute=use_abs)
+            mode = "x"
         elif fig_choice.startswith("Figure 2"):
-            self.canvas = plot_bar_chart(self.canvas, distortions, labels, mode="y", absolute=use_abs)
\ No newline at end of file
+            mode = "y"
+        else:
+            return
+
+        entries = [self.file_data[path] for path in paths]
+        Nzer = max(entry["distortion"].Nzer for entry in entries)
+        num_bins = len(_zernike_ticklabels(Nzer, mode)[0])
+        parameters = self.file_data.parameter_matrix(paths, mode, num_bins)
+        labels = [entry["label"] for entry in entries]
+        self.canvas = plot_parameters(self.canvas, parameters, Nzer, labels, mode=mode, absolute=use_abs)
@@ -0,0 +1,40 @@
+import os
+
+import numpy
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from pycvcam_viz.zernike_distortion_visualizer import MplCanvas, plot_parameters
+
+
+@pytest.fixture(scope="module")
+def canvas():
+    app = QApplication.instance() or QApplication([])
+    yield MplCanvas()
+
+
+@pytest.mark.parametrize("absolute", [False, True])
+def test_plot_parameters_non_finite(canvas, absolute):
+    parameters = numpy.array([[1.0, numpy.inf, -2.0], [numpy.nan, 0.5, -numpy.inf]], dtype=numpy.float32)
+    plot_parameters(canvas, parameters, 1, ["a", "b"], mode="x", absolute=absolute)
+    low, high = canvas.axes.get_ylim()
+    assert numpy.isfinite(low) and numpy.isfinite(high)
+    assert low == pytest.approx(-2.2)
+    assert high == pytest.approx(2.2)
+
+
+def test_plot_parameters_no_finite_value(canvas):
+    parameters = numpy.array([[numpy.nan, numpy.inf, -numpy.inf]], dtype=numpy.float32)
+    plot_parameters(canvas, parameters, 1, ["a"], mode="y")
+    assert canvas.axes.get_ylim() == (-1.0, 1.0)
+
+
+def test_limits_stable_across_absolute_toggle(canvas):
+    parameters = numpy.array([[1.0, -3.0, 2.0]], dtype=numpy.float32)
+    plot_parameters(canvas, parameters, 1, ["a"], mode="x")
+    limits = canvas.axes.get_ylim()
+    canvas.set_absolute(True)
+    assert canvas.axes.get_ylim() == limits
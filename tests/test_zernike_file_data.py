@@ -0,0 +1,95 @@
+import numpy
+import pytest
+
+from pycvcam_viz.zernike_distortion_visualizer import ZernikeFileData
+
+
+def _entry(rng, size_x, size_y=None):
+    size_y = size_x if size_y is None else size_y
+    return {
+        "distortion": None,
+        "label": "label",
+        "parameters_x": rng.standard_normal(size_x),
+        "parameters_y": rng.standard_normal(size_y),
+    }
+
+
+def _padded(vector, num_bins):
+    expected = numpy.zeros(num_bins, dtype=numpy.float32)
+    expected[:len(vector)] = vector
+    return expected
+
+
+def _check(file_data, reference):
+    r"""Compare the matrices of file_data with the zero-padded float32 reference parameters."""
+    assert sorted(file_data) == sorted(reference)
+    assert len(file_data) == len(reference)
+    for path, entry in reference.items():
+        assert path in file_data
+        assert file_data[path] is entry
+    if not reference:
+        return
+    paths = list(reference)
+    num_bins = max(max(len(e["parameters_x"]), len(e["parameters_y"])) for e in reference.values())
+    for mode in ("x", "y"):
+        matrix = file_data.parameter_matrix(paths, mode, num_bins)
+        assert matrix.dtype == numpy.float32
+        assert matrix.shape == (len(paths), num_bins)
+        expected = numpy.stack([_padded(reference[p][f"parameters_{mode}"], num_bins) for p in paths])
+        numpy.testing.assert_array_equal(matrix, expected)
+
+
+def test_add_remove_readd():
+    rng = numpy.random.default_rng(0)
+    file_data = ZernikeFileData()
+    reference = {}
+    for path, size in [("a", 3), ("b", 6), ("c", 10)]:
+        reference[path] = _entry(rng, size)
+        file_data.add(path, reference[path])
+    _check(file_data, reference)
+
+    row_b = file_data._rows["b"]
+    file_data.remove("b")
+    del reference["b"]
+    assert "b" not in file_data
+    _check(file_data, reference)
+    with pytest.raises(KeyError):
+        file_data.remove("b")
+
+    # The freed row is reused and cleared
+    reference["d"] = _entry(rng, 1)
+    file_data.add("d", reference["d"])
+    _check(file_data, reference)
+    assert file_data._rows["d"] == row_b
+
+    # Adding an existing path replaces its parameters
+    reference["a"] = _entry(rng, 2, 5)
+    file_data.add("a", reference["a"])
+    _check(file_data, reference)
+
+
+def test_growth_past_capacity():
+    rng = numpy.random.default_rng(1)
+    file_data = ZernikeFileData()
+    reference = {}
+    for i in range(20):
+        reference[f"f{i}"] = _entry(rng, 1 + 3 * i, 2 + i)
+        file_data.add(f"f{i}", reference[f"f{i}"])
+        _check(file_data, reference)
+    assert file_data._param_matrix_x.shape[0] >= 20
+    assert file_data._param_matrix_x.shape[1] >= 58
+
+
+def test_random_operations():
+    rng = numpy.random.default_rng(3)
+    file_data = ZernikeFileData()
+    reference = {}
+    for _ in range(300):
+        path = f"f{rng.integers(15)}"
+        if path in reference and rng.random() < 0.5:
+            file_data.remove(path)
+            del reference[path]
+        else:
+            reference[path] = _entry(rng, int(rng.integers(1, 30)), int(rng.integers(1, 30)))
+            file_data.add(path, reference[path])
+        _check(file_data, reference)